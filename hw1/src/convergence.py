@@ -2,11 +2,22 @@
 Convergence analysis: error norms and observed convergence orders.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 from analytical import analytical_solution
 from solver import solve_diffusion
 
+# Early exit of the convergence study. Below ROUNDOFF_TOL * max|C| the error is
+# round-off noise and refining further adds nothing. Above it, a level whose
+# Linf error exceeds STALL_RATIO times the previous one is considered stalled.
+# At least MIN_LEVELS levels with a non-zero error are kept so that orders can
+# always be computed and plotted.
+ROUNDOFF_TOL = 1e-12
+STALL_RATIO = 0.9
+MIN_LEVELS = 3
+
 def compute_error_norms(C_numerical, C_analytical):
     """Compute L1, L2, and L-infinity error norms.
 
@@ -25,13 +36,24 @@ def compute_error_norms(C_numerical, C_analytical):
     error = np.abs(C_numerical - C_analytical)
     N = len(error)
     L1 = np.sum(error) / N
-    L2 = np.sqrt(np.sum(error**2) / N)
+    # error @ error sums the squares without allocating error**2
+    L2 = np.sqrt(np.dot(error, error) / N)
     Linf = np.max(error)
     return L1, L2, Linf
 
+def _observed_order(errors, drs):
+    """Observed order between successive levels; NaN where an error is exactly zero."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        order = np.log(errors[:-1] / errors[1:]) / np.log(drs[:-1] / drs[1:])
+    order[~np.isfinite(order)] = np.nan
+    return order
+
 def convergence_study(scheme="forward", initial_grid_size=5, num_refinements=8):
     """Run a grid convergence study for the given finite difference scheme.
 
+    Results are memoized per (scheme, initial_grid_size, num_refinements), so
+    repeated calls (e.g. from several plots) only solve each grid once.
+
     Parameters
     ----------
     scheme : str
@@ -39,14 +61,25 @@ def convergence_study(scheme="forward", initial_grid_size=5, num_refinements=8):
     initial_grid_size : int
         Initial number of grid points (including boundaries).
     num_refinements : int
-        Number of grid refinements to perform.
+        Maximum number of refinements. After MIN_LEVELS non-zero-error levels,
+        the study stops when Linf drops below ROUNDOFF_TOL * max|C| or stops
+        decreasing by STALL_RATIO.
 
     Returns
     -------
     results : dict
         Keys: "N", "dr", "L1", "L2", "Linf", "order_L1", "order_L2", "order_Linf".
-        Each value is a list (or array) over refinement levels.
+        Each value is a list (or array) over the refinement levels reached.
+        Orders are NaN where they are undefined (an exactly zero error).
     """
+    keys = ("N", "dr", "L1", "L2", "Linf", "order_L1", "order_L2", "order_Linf")
+    values = _convergence_study_cached(scheme, initial_grid_size, num_refinements)
+    # Hand out copies so callers cannot alter the cached arrays
+    return {key: value.copy() for key, value in zip(keys, values)}
+
+@lru_cache(maxsize=None)
+def _convergence_study_cached(scheme, initial_grid_size, num_refinements):
+    """Memoized body of convergence_study; returns the results as a tuple."""
     drs = np.empty(num_refinements)
     L1s = np.empty(num_refinements)
     L2s = np.empty(num_refinements)
@@ -65,17 +98,18 @@ def convergence_study(scheme="forward", initial_grid_size=5, num_refinements=8):
         L2s[i] = L2
         Linfs[i] = Linf
 
-    order_L1 = np.log(L1s[:-1] / L1s[1:]) / np.log(drs[:-1] / drs[1:])
-    order_L2 = np.log(L2s[:-1] / L2s[1:]) / np.log(drs[:-1] / drs[1:])
-    order_Linf = np.log(Linfs[:-1] / Linfs[1:]) / np.log(drs[:-1] / drs[1:])
-
-    return {
-        "N": grid_sizes,
-        "dr": drs,
-        "L1": L1s,
-        "L2": L2s,
-        "Linf": Linfs,
-        "order_L1": order_L1,
-        "order_L2": order_L2,
-        "order_Linf": order_Linf,
-    }
\ No newline at end of file
+        # Stop refining once the error is at round-off or no longer decreases:
+        # the remaining, most expensive grids add nothing.
+        floor = ROUNDOFF_TOL * np.max(np.abs(C_ana))
+        at_roundoff = Linfs[i] < floor
+        stalled = i > 0 and Linfs[i - 1] > floor and Linfs[i] > STALL_RATIO * Linfs[i - 1]
+        if np.count_nonzero(Linfs[:i + 1]) >= MIN_LEVELS and (at_roundoff or stalled):
+            grid_sizes = grid_sizes[:i + 1]
+            drs, L1s, L2s, Linfs = drs[:i + 1], L1s[:i + 1], L2s[:i + 1], Linfs[:i + 1]
+            break
+
+    order_L1 = _observed_order(L1s, drs)
+    order_L2 = _observed_order(L2s, drs)
+    order_Linf = _observed_order(Linfs, drs)
+
+    return grid_sizes, drs, L1s, L2s, Linfs, order_L1, order_L2, order_Linf
\ No newline at end of file
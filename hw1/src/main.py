@@ -2,18 +2,25 @@
 Main script to generate all relevant figures for HW1.
 """
 
+import matplotlib.pyplot as plt
+
 from plots import *
 
+# One figure is reused for every plot; each plotting call clears its axes
+fig, ax = plt.subplots(figsize=(8, 5))
+
 print("Running main.py to generate all figures and convergence tables...")
 
 print("\n>>> Scheme 1: Forward difference for dC/dr")
-plot_concentration_profiles(N=5, scheme="forward", filename="concentration_forward.png")
-plot_concentration_profiles(N=33, scheme="forward", filename="concentration_forward_N33.png")
-plot_convergence(scheme="forward", filename="convergence_forward.png")
+plot_concentration_profiles(N=5, scheme="forward", filename="concentration_forward.png", dpi=300, ax=ax)
+plot_concentration_profiles(N=33, scheme="forward", filename="concentration_forward_N33.png", dpi=300, ax=ax)
+plot_convergence(scheme="forward", filename="convergence_forward.png", dpi=300, ax=ax)
 
 print("\n>>> Scheme 2: Central difference for dC/dr")
-plot_concentration_profiles(N=5, scheme="central", filename="concentration_central.png")
-plot_convergence(scheme="central", filename="convergence_central.png")
+plot_concentration_profiles(N=5, scheme="central", filename="concentration_central.png", dpi=300, ax=ax)
+plot_convergence(scheme="central", filename="convergence_central.png", dpi=300, ax=ax)
 
 print("\n>>> Generating comparison plot (both schemes vs analytical)...")
-plot_comparison(N=5, filename="comparison_both_schemes.png")
+plot_comparison(N=5, filename="comparison_both_schemes.png", dpi=300, ax=ax)
+
+plt.close(fig)
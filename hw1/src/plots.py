@@ -3,7 +3,10 @@ Plotting routines for the diffusion solver results and convergence analysis.
 """
 
 import os
+from functools import lru_cache
 
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -14,7 +17,45 @@ from convergence import *
 # Save plots in ../results/ relative to this script (in src/)
 RESULTS_DIR = os.path.join(os.path.dirname(__file__), "..", "results")
 
-def plot_concentration_profiles(N=5, scheme="forward", filename="concentration_profile.png"):
+# Default resolution of saved figures; kept low for quick iterations, main.py
+# asks for publication quality explicitly. Override with MEC8211_DPI.
+DEFAULT_DPI = 100
+
+# Fast, light zlib compression for the PNG encoder: line plots compress well
+# anyway and the default level dominates save time at high dpi.
+PNG_KWARGS = {"compress_level": 1}
+
+@lru_cache(maxsize=32)
+def _solve_cached(N, scheme="forward"):
+    """Memoized solve_diffusion shared by the profile and comparison plots.
+
+    The returned arrays are shared between callers, so they are made read-only.
+    """
+    r, C = solve_diffusion(N, scheme=scheme)
+    r.flags.writeable = False
+    C.flags.writeable = False
+    return r, C
+
+def _resolve_dpi(dpi=None):
+    """Return dpi, or the MEC8211_DPI environment variable (default DEFAULT_DPI) if None."""
+    if dpi is not None:
+        return dpi
+    value = os.environ.get("MEC8211_DPI")
+    if value is None:
+        return DEFAULT_DPI
+    if not value.strip().isdigit() or int(value) <= 0:
+        raise ValueError(f"MEC8211_DPI must be a positive integer, got '{value}'.")
+    return int(value)
+
+def _prepare_axes(ax=None):
+    """Return (fig, ax, owns_fig): a new 8x5 figure, or the given axes cleared for reuse."""
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(8, 5))
+        return fig, ax, True
+    ax.cla()
+    return ax.figure, ax, False
+
+def plot_concentration_profiles(N=5, scheme="forward", filename="concentration_profile.png", dpi=None, ax=None):
     """
     Plot numerical vs analytical concentration profiles for a given grid size and scheme.
     
@@ -26,13 +67,19 @@ def plot_concentration_profiles(N=5, scheme="forward", filename="concentration_p
         Finite difference scheme to use ("forward" or "central").
     filename : str
         Name of the output PNG file to save the plot.
+    dpi : int, optional
+        Resolution of the saved figure. Defaults to the MEC8211_DPI
+        environment variable, or DEFAULT_DPI if it is not set.
+    ax : matplotlib.axes.Axes, optional
+        Axes to clear and draw on, so one figure can be reused across plots.
+        A new figure is created (and closed after saving) if None.
     """
 
-    r_num, C_num = solve_diffusion(N, scheme=scheme)
+    r_num, C_num = _solve_cached(N, scheme=scheme)
     r_analytical = np.linspace(0.0, 0.5, 500)
     C_ana = analytical_solution(r_analytical)
 
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax, owns_fig = _prepare_axes(ax)
     ax.plot(r_analytical, C_ana, color="black", linewidth=2, label="Analytical")
     ax.plot(r_num, C_num, color="red", ls="--", marker="o", markersize=5, label=f"Numerical ({scheme}, N={N})")
     ax.set_xlabel("r [m]")
@@ -40,12 +87,13 @@ def plot_concentration_profiles(N=5, scheme="forward", filename="concentration_p
     ax.set_title("Salt Concentration Profile in Concrete Pillar")
     ax.legend()
     ax.grid()
-    fig.tight_layout()
     
     filepath = os.path.join(RESULTS_DIR, filename)
-    fig.savefig(filepath, dpi=300)
+    fig.savefig(filepath, dpi=_resolve_dpi(dpi), bbox_inches="tight", pil_kwargs=PNG_KWARGS)
+    if owns_fig:
+        plt.close(fig)
     
-def plot_convergence(scheme="forward", filename="convergence_plot.png"):
+def plot_convergence(scheme="forward", filename="convergence_plot.png", dpi=None, ax=None):
     """
     Plot log-log convergence of error norms for a given finite difference scheme.
     
@@ -55,21 +103,33 @@ def plot_convergence(scheme="forward", filename="convergence_plot.png"):
         Finite difference scheme to use ("forward" or "central").
     filename : str
         Name of the output PNG file to save the plot.
+    dpi : int, optional
+        Resolution of the saved figure. Defaults to the MEC8211_DPI
+        environment variable, or DEFAULT_DPI if it is not set.
+    ax : matplotlib.axes.Axes, optional
+        Axes to clear and draw on, so one figure can be reused across plots.
+        A new figure is created (and closed after saving) if None.
     """
     results = convergence_study(scheme=scheme)
     
     dr = results["dr"]
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax, owns_fig = _prepare_axes(ax)
 
     for norm_name, marker in [("L1", "o"), ("L2", "s"), ("Linf", "^")]:
-        ax.loglog(dr, results[norm_name], f"-{marker}", label=norm_name)
+        # Exactly zero errors (exact solution) cannot be drawn on a log scale
+        errors = np.where(results[norm_name] > 0, results[norm_name], np.nan)
+        ax.loglog(dr, errors, f"-{marker}", label=norm_name)
 
-    # Reference slopes for O(r) and O(r2)   
-    dr_ref = np.array([dr.min(), dr.max()])
-    scale1 = results["L2"][0] / dr[0]
-    scale2 = results["L2"][0] / dr[0]**2
-    ax.loglog(dr_ref, scale1 * dr_ref, "k--", label=r"$O(\Delta r)$")
-    ax.loglog(dr_ref, scale2 * dr_ref**2, "k:", label=r"$O(\Delta r^2)$")
+    # Reference slopes for O(r) and O(r2), anchored at the coarsest level with a
+    # non-zero error
+    nonzero = np.flatnonzero(results["L2"] > 0)
+    if nonzero.size:
+        i0 = nonzero[0]
+        dr_ref = np.array([dr.min(), dr.max()])
+        scale1 = results["L2"][i0] / dr[i0]
+        scale2 = results["L2"][i0] / dr[i0]**2
+        ax.loglog(dr_ref, scale1 * dr_ref, "k--", label=r"$O(\Delta r)$")
+        ax.loglog(dr_ref, scale2 * dr_ref**2, "k:", label=r"$O(\Delta r^2)$")
 
     ax.set_xlabel(r"$\Delta r$ [m]")
     ax.set_ylabel("Error norm")
@@ -78,9 +138,11 @@ def plot_convergence(scheme="forward", filename="convergence_plot.png"):
     ax.grid()
     
     filepath = os.path.join(RESULTS_DIR, filename)
-    fig.savefig(filepath, dpi=300)
+    fig.savefig(filepath, dpi=_resolve_dpi(dpi), bbox_inches="tight", pil_kwargs=PNG_KWARGS)
+    if owns_fig:
+        plt.close(fig)
     
-def plot_comparison(N=5, filename="concentration_profile_scheme_comparison.png"):
+def plot_comparison(N=5, filename="concentration_profile_scheme_comparison.png", dpi=None, ax=None):
     """Plot concentration profiles for both forward and central schemes.
 
     Parameters
@@ -89,13 +151,19 @@ def plot_comparison(N=5, filename="concentration_profile_scheme_comparison.png")
         Number of grid points (including boundaries) for the numerical solutions.
     filename : str
         Name of the output PNG file to save the plot.
+    dpi : int, optional
+        Resolution of the saved figure. Defaults to the MEC8211_DPI
+        environment variable, or DEFAULT_DPI if it is not set.
+    ax : matplotlib.axes.Axes, optional
+        Axes to clear and draw on, so one figure can be reused across plots.
+        A new figure is created (and closed after saving) if None.
     """
-    r_fwd, C_fwd = solve_diffusion(N, scheme="forward")
-    r_ctr, C_ctr = solve_diffusion(N, scheme="central")
+    r_fwd, C_fwd = _solve_cached(N, scheme="forward")
+    r_ctr, C_ctr = _solve_cached(N, scheme="central")
     r_analytical = np.linspace(0.0, 0.5, 500)
     C_ana = analytical_solution(r_analytical)
 
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax, owns_fig = _prepare_axes(ax)
     ax.plot(r_analytical, C_ana, color="black", linewidth=2, label="Analytical")
     ax.plot(r_fwd, C_fwd, color="red", ls="--", marker="o", markersize=5, label=f"Forward ({N} pts)")
     ax.plot(r_ctr, C_ctr, color="blue", ls="--", marker="s", markersize=5, label=f"Central ({N} pts)")
@@ -104,7 +172,8 @@ def plot_comparison(N=5, filename="concentration_profile_scheme_comparison.png")
     ax.set_title("Concentration Profiles: Forward vs Central Schemes")
     ax.legend()
     ax.grid()
-    fig.tight_layout()
     
     filepath = os.path.join(RESULTS_DIR, filename)
-    fig.savefig(filepath, dpi=300)
\ No newline at end of file
+    fig.savefig(filepath, dpi=_resolve_dpi(dpi), bbox_inches="tight", pil_kwargs=PNG_KWARGS)
+    if owns_fig:
+        plt.close(fig)
\ No newline at end of file
@@ -3,6 +3,49 @@ Finite difference solver for steady-state radial diffusion (1D) in a cylinder.
 """
 
 import numpy as np
+from scipy.linalg import solve_banded
+
+def _interior_forward(inv_r, dr, D_eff):
+    """Interior stencil coefficients for Scheme 1 (forward difference on dC/dr).
+
+    Parameters
+    ----------
+    inv_r : ndarray
+        Reciprocal radial positions 1/r_i of the interior nodes, shape (N-2,).
+    dr : float
+        Grid spacing [m].
+    D_eff : float
+        Effective diffusion coefficient [m2/s].
+
+    Returns
+    -------
+    coeff_im1, coeff_i, coeff_ip1 : ndarray
+        Coefficients of C_{i-1}, C_i and C_{i+1} for each interior row.
+    """
+    _dr2 = 1 / dr**2
+    _rdr = (D_eff / dr) * inv_r    # D_eff / (r_i * dr)
+
+    # d2C/dr2 ≈ (C_{i+1} - 2*C_i + C_{i-1}) / dr2
+    # dC/dr   ≈ (C_{i+1} - C_i) / dr
+    coeff_im1 = np.full(inv_r.shape, D_eff * _dr2)
+    coeff_i = -2.0 * D_eff * _dr2 - _rdr
+    coeff_ip1 = D_eff * _dr2 + _rdr
+    return coeff_im1, coeff_i, coeff_ip1
+
+def _interior_central(inv_r, dr, D_eff):
+    """Interior stencil coefficients for Scheme 2 (central difference on dC/dr).
+
+    Same parameters and returns as `_interior_forward`.
+    """
+    _dr2 = 1 / dr**2
+    _rdr = (0.5 * D_eff / dr) * inv_r    # D_eff / (2 * r_i * dr)
+
+    # d2C/dr2 ≈ (C_{i+1} - 2*C_i + C_{i-1}) / dr2
+    # dC/dr   ≈ (C_{i+1} - C_{i-1}) / (2*dr)
+    coeff_im1 = D_eff * _dr2 - _rdr
+    coeff_i = np.full(inv_r.shape, -2.0 * D_eff * _dr2)
+    coeff_ip1 = D_eff * _dr2 + _rdr
+    return coeff_im1, coeff_i, coeff_ip1
 
 def solve_diffusion(N, scheme="forward", S=2e-8, D_eff=1e-10, R=0.5, Ce=20.0):
     """Solve the steady-state radial diffusion equation using finite differences.
@@ -40,44 +83,43 @@ def solve_diffusion(N, scheme="forward", S=2e-8, D_eff=1e-10, R=0.5, Ce=20.0):
     dr = R / (N - 1)
     r = np.linspace(0., R, N)
 
-    A = np.zeros((N, N))
+    # Tridiagonal matrix in LAPACK banded storage: ab[1 + i - j, j] = A[i, j]
+    # (row 0: upper diagonal, row 1: main diagonal, row 2: lower diagonal)
+    ab = np.zeros((3, N))
     b = np.zeros(N)
 
-    # --- Interior domain ---
-    _dr2 = 1 / dr**2
-    for i in range(1, N - 1):
-        r_i = r[i]
-
-        # d2C/dr2 ≈ (C_{i+1} - 2*C_i + C_{i-1}) / dr2
-        coeff_im1 = D_eff * _dr2          # coefficient of C_{i-1}
-        coeff_i = -2.0 * D_eff * _dr2     # coefficient of C_i
-        coeff_ip1 = D_eff * _dr2           # coefficient of C_{i+1}
-
-        match scheme:
-            case "forward":
-                # dC/dr ≈ (C_{i+1} - C_i) / dr
-                coeff_i -= D_eff / (r_i * dr)
-                coeff_ip1 += D_eff / (r_i * dr)
-            case "central":
-                # dC/dr ≈ (C_{i+1} - C_{i-1}) / (2*dr)
-                coeff_im1 -= D_eff / (r_i * 2.0 * dr)
-                coeff_ip1 += D_eff / (r_i * 2.0 * dr)
-
-        A[i, i - 1] = coeff_im1
-        A[i, i] = coeff_i
-        A[i, i + 1] = coeff_ip1
-        b[i] = S
-        
+    # --- Interior domain (rows 1 .. N-2, vectorized) ---
+    inv_r = 1.0 / r[1:-1]    # single division pass, shared by the (1/r)*dC/dr terms
+    match scheme:
+        case "forward":
+            coeff_im1, coeff_i, coeff_ip1 = _interior_forward(inv_r, dr, D_eff)
+        case "central":
+            coeff_im1, coeff_i, coeff_ip1 = _interior_central(inv_r, dr, D_eff)
+        case _:
+            raise ValueError(f"Unknown scheme '{scheme}', expected 'forward' or 'central'.")
+
+    ab[2, :-2] = coeff_im1
+    ab[1, 1:-1] = coeff_i
+    ab[0, 2:] = coeff_ip1
+    b[1:-1] = S
+
     # --- Homogenous Neumann BC @ R = 0: dC/dr = 0 ---
     # 2nd-order foward difference to maintain O(Δr2) accuracy at the boundary for both schemes:
-    A[0, 0] = -3.0
-    A[0, 1] = 4.0
-    A[0, 2] = -1.0
-    b[0] = 0.0
+    #   -3*C_0 + 4*C_1 - C_2 = 0
+    # The C_2 term falls outside the tridiagonal band, so it is eliminated by
+    # adding row 1 scaled by 1/A[1, 2] (one Gauss step).
+    if ab[0, 2] == 0.0:
+        raise np.linalg.LinAlgError("Singular matrix: A[1, 2] = 0 (check D_eff and N).")
+    _a12 = 1.0 / ab[0, 2]
+    ab[1, 0] = -3.0 + ab[2, 0] * _a12
+    ab[0, 1] = 4.0 + ab[1, 1] * _a12
+    b[0] = b[1] * _a12
 
     # --- Dirichlet BC @ r = R: C = Ce ---
-    A[-1, -1] = 1.0
+    ab[1, -1] = 1.0
     b[-1] = Ce
 
-    C = np.linalg.solve(A, b)
+    # Tridiagonal (1, 1) bands are solved by LAPACK ?gtsv. ab and b are scratch
+    # arrays, so let the solver overwrite them instead of copying.
+    C = solve_banded((1, 1), ab, b, overwrite_ab=True, overwrite_b=True)
     return r, C
\ No newline at end of file
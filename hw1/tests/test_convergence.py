@@ -0,0 +1,60 @@
+"""Tests for the grid convergence study."""
+
+import warnings
+
+import numpy as np
+
+from convergence import MIN_LEVELS, convergence_study
+
+
+class TestMemoization:
+    def test_repeated_calls_are_equal(self):
+        """A repeated call must return the same results as the first one."""
+        first = convergence_study("forward", initial_grid_size=5, num_refinements=4)
+        second = convergence_study("forward", initial_grid_size=5, num_refinements=4)
+        assert first.keys() == second.keys()
+        for key in first:
+            np.testing.assert_array_equal(first[key], second[key])
+
+    def test_results_are_independent_copies(self):
+        """Mutating a returned dict or its arrays must not affect the next call."""
+        first = convergence_study("forward", initial_grid_size=5, num_refinements=4)
+        L2_before = first["L2"].copy()
+        N_before = list(first["N"])
+
+        first["L2"][:] = -1.0
+        first["N"].append(0)
+        first["dr"] = None
+
+        second = convergence_study("forward", initial_grid_size=5, num_refinements=4)
+        np.testing.assert_array_equal(second["L2"], L2_before)
+        assert second["N"] == N_before
+        assert second["dr"] is not None
+
+
+class TestEarlyExit:
+    def test_forward_keeps_all_levels(self):
+        """The forward scheme converges steadily: no refinement level is dropped."""
+        results = convergence_study("forward", initial_grid_size=5, num_refinements=8)
+        assert results["N"] == [5, 9, 17, 33, 65, 129, 257, 513]
+        assert len(results["order_L2"]) == 7
+        assert np.all(np.isfinite(results["order_L2"]))
+        np.testing.assert_allclose(results["order_L2"][-1], 1.0, atol=0.05)
+
+    def test_central_output_is_well_defined(self):
+        """Central is exact up to round-off: the study stops early, cleanly."""
+        # num_refinements=7 is used by no other test, so the solves always run
+        # here (not served from the memoization cache) and warnings are seen.
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            results = convergence_study("central", initial_grid_size=5, num_refinements=7)
+
+        assert len(results["N"]) < 7
+        assert np.count_nonzero(results["L2"]) >= MIN_LEVELS
+        for key in ("dr", "L1", "L2", "Linf"):
+            assert len(results[key]) == len(results["N"])
+        assert np.all(results["Linf"] < 1e-10)
+        for key in ("order_L1", "order_L2", "order_Linf"):
+            assert len(results[key]) == len(results["N"]) - 1
+            assert not np.any(np.isinf(results[key]))
+            assert np.any(np.isfinite(results[key]))
@@ -52,6 +52,32 @@ class TestSolverBoundaryConditions:
         assert dCdr == pytest.approx(0.0, abs=1e-12)
 
 
+class TestSchemeSelection:
+    def test_schemes_differ(self):
+        """Forward and central schemes must assemble different systems."""
+        _, C_fwd = solve_diffusion(20, scheme="forward")
+        _, C_ctr = solve_diffusion(20, scheme="central")
+        assert not np.allclose(C_fwd, C_ctr)
+
+    def test_unknown_scheme(self):
+        """An unknown scheme name must be rejected, not silently ignored."""
+        with pytest.raises(ValueError):
+            solve_diffusion(20, scheme="backward")
+
+
+class TestInvalidInputs:
+    @pytest.mark.parametrize("scheme", ["forward", "central"])
+    def test_zero_diffusivity(self, scheme):
+        """D_eff = 0 makes the system singular: it must raise, not return NaNs."""
+        with pytest.raises(np.linalg.LinAlgError):
+            solve_diffusion(20, scheme=scheme, D_eff=0.0)
+
+    def test_non_finite_source(self):
+        """A non-finite source term must be rejected by the linear solve."""
+        with pytest.raises(ValueError):
+            solve_diffusion(20, S=np.nan)
+
+
 class TestZeroSource:
     """With S=0 the exact solution is C(r) = Ce everywhere."""
 
@@ -70,6 +96,20 @@ class TestSolverMonotonicity:
         assert np.all(np.diff(C) >= 0)
 
 
+class TestForwardScheme:
+    """Regression for the (1/r)*dC/dr coefficient of the forward scheme: D_eff / (r_i * dr)."""
+
+    def test_first_order_convergence(self):
+        """Halving dr must halve the Linf error (observed order -> 1)."""
+        errors = []
+        for N in (65, 129, 257):
+            r, C = solve_diffusion(N, scheme="forward", S=S, D_eff=D_EFF, R=R, Ce=CE)
+            C_ana = analytical_solution(r, S=S, D_eff=D_EFF, R=R, Ce=CE)
+            errors.append(np.max(np.abs(C - C_ana)))
+        orders = np.log2(np.array(errors[:-1]) / np.array(errors[1:]))
+        np.testing.assert_allclose(orders, 1.0, atol=0.05)
+
+
 class TestConservation:
     """Flux balance: total source in the domain must equal diffusive flux out at r=R."""
 
@@ -2,6 +2,9 @@
 Convergence analysis: error norms and observed convergence orders.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
 from solver import DiffusionParams, solve_diffusion
@@ -22,15 +25,44 @@ def compute_error_norms(C_numerical, C_manufactured):
     L1, L2, Linf : float
         Error norms.
     """
-    error = np.abs(C_numerical - C_manufactured)
+    # Single (N_t, N_r) temporary: abs is taken in place and the squares are
+    # summed by a dot product instead of materialising error**2
+    error = np.subtract(C_numerical, C_manufactured)
+    np.abs(error, out=error)
     N_t, N_r = error.shape
-    L1   = np.sum(error) / (N_t * N_r)
-    L2   = np.sqrt(np.sum(error**2) / (N_t * N_r))
-    Linf = np.max(error)
+    flat = error.ravel()
+    L1   = np.sum(flat) / (N_t * N_r)
+    L2   = np.sqrt(np.dot(flat, flat) / (N_t * N_r))
+    Linf = np.max(flat)
     return L1, L2, Linf
 
 
-def convergence_study_spatial(base_params):
+def _refinement_errors(params):
+    """Solve one refinement level of an MMS convergence study.
+
+    Top-level function so it can be dispatched to worker processes.
+
+    Parameters
+    ----------
+    params : DiffusionParams
+        Parameters of this refinement level (mms must be True).
+
+    Returns
+    -------
+    dr, dt, L1, L2, Linf : float
+        Grid spacings of this level and its error norms.
+    """
+    # Derive the MMS once and share it with the solver. The manufactured IC is
+    # evaluated on the solver's own grid.
+    C_fn, S_fn = params.mms_functions()
+    r, time, C_num = solve_diffusion(params, C_0=lambda r: C_fn(r, 0.0),
+                                     mms_fns=(C_fn, S_fn))
+    C_ana = C_fn(r[np.newaxis, :], time[:, np.newaxis])
+    L1, L2, Linf = compute_error_norms(C_num, C_ana)
+    return r[1] - r[0], time[1] - time[0], L1, L2, Linf
+
+
+def convergence_study_spatial(base_params, max_workers=None):
     """Spatial convergence study: refine the radial grid, keep N_t fixed.
 
     The coarsest grid starts at ``base_params.N_r`` and is doubled
@@ -43,6 +75,9 @@ def convergence_study_spatial(base_params):
         Provides all parameters. Physical params (D_eff, R, k) and convergence
         settings (N_t_conv, num_refinements, t_max) are used directly.
         Ce and mms are taken from base_params unchanged.
+    max_workers : int, optional
+        Number of worker processes solving refinement levels in parallel.
+        Defaults to the number of CPUs, capped at num_refinements.
 
     Returns
     -------
@@ -62,24 +97,22 @@ def convergence_study_spatial(base_params):
 
     # Start from base_params.N_r, halve dr at each level: N -> 2*(N-1)+1
     grid_sizes = [(base_params.N_r - 1) * (2**i) + 1 for i in range(num_refinements)]
-    C_fn, _ = base_params.mms_functions()
-
-    for i, N in enumerate(grid_sizes):
-        params = DiffusionParams(D_eff=base_params.D_eff, R=base_params.R,
-                                 k=base_params.k, Ce=base_params.Ce,
-                                 N_r=N, N_t=N_t, t_max=t_max,
-                                 mms=base_params.mms,
-                                 mms_solution=base_params.mms_solution)
-        r = np.linspace(0, params.R, N)
-        C_0 = C_fn(r, 0.0)
-        r, time, C_num = solve_diffusion(params, C_0=C_0)
-        C_ana = C_fn(r[np.newaxis, :], time[:, np.newaxis])
-        L1, L2, Linf = compute_error_norms(C_num, C_ana)
-
-        drs[i]   = r[1] - r[0]
-        L1s[i]   = L1
-        L2s[i]   = L2
-        Linfs[i] = Linf
+    levels = [DiffusionParams(D_eff=base_params.D_eff, R=base_params.R,
+                              k=base_params.k, Ce=base_params.Ce,
+                              N_r=N, N_t=N_t, t_max=t_max,
+                              mms=base_params.mms,
+                              mms_solution=base_params.mms_solution)
+              for N in grid_sizes]
+
+    # Refinement levels are independent: solve them in parallel, with no more
+    # workers than there are levels
+    n_workers = min(max_workers or os.cpu_count() or 1, len(levels))
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for i, (dr, _, L1, L2, Linf) in enumerate(executor.map(_refinement_errors, levels)):
+            drs[i]   = dr
+            L1s[i]   = L1
+            L2s[i]   = L2
+            Linfs[i] = Linf
 
     order_L1   = np.log(L1s[:-1]   / L1s[1:])   / np.log(drs[:-1] / drs[1:])
     order_L2   = np.log(L2s[:-1]   / L2s[1:])   / np.log(drs[:-1] / drs[1:])
@@ -97,7 +130,7 @@ def convergence_study_spatial(base_params):
     }
 
 
-def convergence_study_temporal(base_params):
+def convergence_study_temporal(base_params, max_workers=None):
     """Temporal convergence study: refine the time grid, keep N_r fixed.
 
     The coarsest grid starts at ``base_params.N_t`` and is doubled
@@ -110,6 +143,9 @@ def convergence_study_temporal(base_params):
         Provides all parameters. Physical params (D_eff, R, k) and convergence
         settings (N_r_conv, num_refinements, t_max) are used directly.
         Ce and mms are taken from base_params unchanged.
+    max_workers : int, optional
+        Number of worker processes solving refinement levels in parallel.
+        Defaults to the number of CPUs, capped at num_refinements.
 
     Returns
     -------
@@ -130,24 +166,22 @@ def convergence_study_temporal(base_params):
 
     # Start from base_params.N_t, double the step count at each level
     grid_sizes = [base_params.N_t * (2**i) for i in range(num_refinements)]
-    C_fn, _ = base_params.mms_functions()
-
-    for i, N in enumerate(grid_sizes):
-        params = DiffusionParams(D_eff=base_params.D_eff, R=base_params.R,
-                                 k=base_params.k, Ce=base_params.Ce,
-                                 N_r=N_r, N_t=N, t_max=t_max,
-                                 mms=base_params.mms,
-                                 mms_solution=base_params.mms_solution)
-        r = np.linspace(0, params.R, N_r)
-        C_0 = C_fn(r, 0.0)
-        r, time, C_num = solve_diffusion(params, C_0=C_0)
-        C_ana = C_fn(r[np.newaxis, :], time[:, np.newaxis])
-        L1, L2, Linf = compute_error_norms(C_num, C_ana)
-
-        dts[i]   = time[1] - time[0]
-        L1s[i]   = L1
-        L2s[i]   = L2
-        Linfs[i] = Linf
+    levels = [DiffusionParams(D_eff=base_params.D_eff, R=base_params.R,
+                              k=base_params.k, Ce=base_params.Ce,
+                              N_r=N_r, N_t=N, t_max=t_max,
+                              mms=base_params.mms,
+                              mms_solution=base_params.mms_solution)
+              for N in grid_sizes]
+
+    # Refinement levels are independent: solve them in parallel, with no more
+    # workers than there are levels
+    n_workers = min(max_workers or os.cpu_count() or 1, len(levels))
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for i, (_, dt, L1, L2, Linf) in enumerate(executor.map(_refinement_errors, levels)):
+            dts[i]   = dt
+            L1s[i]   = L1
+            L2s[i]   = L2
+            Linfs[i] = Linf
 
     order_L1   = np.log(L1s[:-1]   / L1s[1:])   / np.log(dts[:-1] / dts[1:])
     order_L2   = np.log(L2s[:-1]   / L2s[1:])   / np.log(dts[:-1] / dts[1:])
@@ -6,6 +6,8 @@ import json
 from dataclasses import dataclass, asdict, fields
 
 import numpy as np
+from scipy.sparse import diags
+from scipy.sparse.linalg import splu
 
 from mms import DEFAULT_MMS, derive_mms
 
@@ -101,7 +103,7 @@ class DiffusionParams:
         return cls(**{k: v for k, v in data.items() if k in known})
 
 
-def solve_diffusion(params: DiffusionParams, C_0=0.0):
+def solve_diffusion(params: DiffusionParams, C_0=0.0, mms_fns=None):
     """Solve the transient radial diffusion equation using implicit Euler (BDF1).
 
     Spatial discretisation: 2nd-order central differences for both d^2C/dr^2
@@ -117,10 +119,15 @@ def solve_diffusion(params: DiffusionParams, C_0=0.0):
     ----------
     params : DiffusionParams
         All physical and numerical parameters.
-    C_0 : float or ndarray of shape (N_r,)
+    C_0 : float, ndarray of shape (N_r,), or callable(r) -> ndarray
         Initial concentration [mol/m3]. A scalar broadcasts to all nodes;
         pass an array for a spatially-varying IC (e.g. C_fn(r, 0) where
-        C_fn comes from params.mms_functions()).
+        C_fn comes from params.mms_functions()), or a callable to have it
+        evaluated on the solver's own radial grid.
+    mms_fns : tuple of callables, optional
+        ``(C_fn, S_fn)`` already returned by params.mms_functions(), to avoid
+        repeating the SymPy derivation. Derived here if None. Ignored unless
+        params.mms is True.
 
     Returns
     -------
@@ -139,40 +146,49 @@ def solve_diffusion(params: DiffusionParams, C_0=0.0):
     dt = t_max / (N_t - 1)
     t  = np.linspace(0, t_max, N_t)
 
-    A = np.zeros((N_r, N_r))
     b = np.zeros(N_r)
 
+    # Diagonals of the sparse system matrix: A[i, i-1], A[i, i], A[i, i+1], A[i, i+2]
+    lower  = np.zeros(N_r - 1)
+    diag   = np.zeros(N_r)
+    upper  = np.zeros(N_r - 1)
+    upper2 = np.zeros(N_r - 2)
+
     # --- Interior domain (assembled once, A is time-independent) ---
     _dr2 = 1.0 / dr**2
-    for i in range(1, N_r - 1):
-        r_i = r[i]
-
-        # BDF1: C_i^{n+1} - dt*(D_eff*Lap - k)*C_i^{n+1} = C_i^n + dt*S^{n+1}
-        coeff_im1 = -dt * D_eff * _dr2 + dt * D_eff / (2.0 * r_i * dr)
-        coeff_i   =  dt * D_eff * (2.0 * _dr2) + dt * k
-        coeff_ip1 = -dt * D_eff * _dr2 - dt * D_eff / (2.0 * r_i * dr)
+    r_i  = r[1:-1]
 
-        A[i, i - 1] = coeff_im1
-        A[i, i]     = coeff_i + 1.0   # +1 from identity (time derivative)
-        A[i, i + 1] = coeff_ip1
+    # BDF1: C_i^{n+1} - dt*(D_eff*Lap - k)*C_i^{n+1} = C_i^n + dt*S^{n+1}
+    lower[:-1] = -dt * D_eff * _dr2 + dt * D_eff / (2.0 * r_i * dr)
+    diag[1:-1] =  dt * D_eff * (2.0 * _dr2) + dt * k + 1.0   # +1 from identity (time derivative)
+    upper[1:]  = -dt * D_eff * _dr2 - dt * D_eff / (2.0 * r_i * dr)
 
     # --- Neumann BC @ r=0: dC/dr = 0 (2nd-order one-sided) ---
-    A[0, 0] = -3.0
-    A[0, 1] =  4.0
-    A[0, 2] = -1.0
-    b[0]    =  0.0
+    diag[0]   = -3.0
+    upper[0]  =  4.0
+    upper2[0] = -1.0
+    b[0]      =  0.0
 
     # --- Dirichlet BC @ r=R: C = Ce ---
-    A[-1, -1] = 1.0
-    b[-1]     = Ce
+    diag[-1] = 1.0
+    b[-1]    = Ce
+
+    # Sparse LU factorisation, computed once and reused at every time step
+    A  = diags([lower, diag, upper, upper2], offsets=[-1, 0, 1, 2], format="csc")
+    lu = splu(A)
 
     # --- MMS functions (derived once before the time loop) ---
-    C_fn, S_fn = params.mms_functions() if params.mms else (None, None)
+    if not params.mms:
+        C_fn, S_fn = None, None
+    elif mms_fns is not None:
+        C_fn, S_fn = mms_fns
+    else:
+        C_fn, S_fn = params.mms_functions()
 
     # --- Time integration ---
     C = np.zeros((N_t, N_r))
     C_t = np.zeros(N_r)
-    C_t[:] = C_0
+    C_t[:] = C_0(r) if callable(C_0) else C_0
     C[0, :] = C_t.copy()
 
     for i, t_i in enumerate(t[1:], start=1):
@@ -180,7 +196,7 @@ def solve_diffusion(params: DiffusionParams, C_0=0.0):
         if S_fn is not None:
             b[1:-1] += dt * S_fn(r, t_i)[1:-1]
             b[-1] = C_fn(R, t_i)   # time-varying Dirichlet BC from MMS
-        C_t      = np.linalg.solve(A, b)
+        C_t      = lu.solve(b)
         C[i, :] = C_t.copy()
 
     return r, t, C
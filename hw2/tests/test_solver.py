@@ -53,6 +53,14 @@ class TestBoundaryConditions:
         r, t, C = solve_diffusion(params, C_0=5.0)
         np.testing.assert_allclose(C[0, :-1], 5.0, atol=1e-12)
 
+    def test_initial_condition_callable(self):
+        """A callable C_0 is evaluated on the solver grid, same as passing the array."""
+        params = make_params(N_r=21)
+        r_grid = np.linspace(0, R, 21)
+        _, _, C_ref = solve_diffusion(params, C_0=1.0 + r_grid**2)
+        _, _, C = solve_diffusion(params, C_0=lambda r: 1.0 + r**2)
+        np.testing.assert_array_equal(C, C_ref)
+
     def test_initial_condition_array(self):
         """C[0, :] must match an array C_0 at interior nodes."""
         params = make_params(N_r=21)
@@ -136,6 +144,14 @@ class TestMMS:
         Linf = np.max(np.abs(C - C_ana))
         assert Linf < 1e-3
 
+    def test_precomputed_mms_functions(self, mms_params):
+        """Passing (C_fn, S_fn) must give the same solution as deriving them."""
+        C_fn, S_fn = mms_params.mms_functions()
+        C_0 = lambda r: C_fn(r, 0.0)
+        _, _, C_ref = solve_diffusion(mms_params, C_0=C_0)
+        _, _, C = solve_diffusion(mms_params, C_0=C_0, mms_fns=(C_fn, S_fn))
+        np.testing.assert_array_equal(C, C_ref)
+
     def test_mms_finer_grid_reduces_error(self, mms_params):
         """Spatial grid refinement must monotonically reduce the Linf error."""
         from dataclasses import replace
@@ -169,3 +185,37 @@ class TestMMS:
         C_ana = C_fn(r[np.newaxis, :], t[:, np.newaxis])
         Linf = np.max(np.abs(C - C_ana))
         assert Linf > 1e-2
+
+
+# ---------------------------------------------------------------------------
+# Convergence studies
+# ---------------------------------------------------------------------------
+
+class TestConvergenceStudy:
+    """Observed orders from the (parallel) MMS convergence studies."""
+
+    @pytest.fixture
+    def conv_params(self):
+        return DiffusionParams(
+            D_eff=1.0, R=1.0, Ce=0.0, k=1.0,
+            N_r=11, N_t=50, t_max=1.0,
+            mms=True,
+            mms_solution="exp(-t) * (1 - (r/R)**4)",
+            N_r_conv=200, N_t_conv=2000, num_refinements=3,
+            run_name="test_conv",
+        )
+
+    def test_spatial_order(self, conv_params):
+        """Central differences in r must converge at 2nd order."""
+        from convergence import convergence_study_spatial
+
+        results = convergence_study_spatial(conv_params, max_workers=2)
+        assert len(results["L2"]) == conv_params.num_refinements
+        np.testing.assert_allclose(results["order_L2"], 2.0, atol=0.2)
+
+    def test_temporal_order(self, conv_params):
+        """Backward Euler in t must converge at 1st order."""
+        from convergence import convergence_study_temporal
+
+        results = convergence_study_temporal(conv_params, max_workers=2)
+        np.testing.assert_allclose(results["order_L2"], 1.0, atol=0.2)